@@ -13,14 +13,46 @@ PROBLEMS:
 5. Vendor lock-in
 """
 
-from typing import Dict, Optional
-import requests  # Direct dependency on external library
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import asyncio
+import logging
+import time
+import aiohttp  # Direct dependency on external library
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 # ============================================================================
 # BAD: Direct coupling to Stripe API
 # ============================================================================
 
+# Fields that are identical for every payment intent we create
+_CHECKOUT_TEMPLATE = {
+    "currency": "usd",
+    "confirmation_method": "manual",
+    "confirm": True
+}
+
+
+def _idempotency_header(operation: str,
+                        idempotency_key: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Extra request headers so Stripe itself also de-duplicates retries.
+    
+    Stripe keys are account-wide, so the key is namespaced by operation -
+    the same client key can then be used for a charge and its refund,
+    matching the local cache.
+    """
+    if idempotency_key is None:
+        return None
+    return {"Idempotency-Key": f"{operation}:{idempotency_key}"}
+
+
 class ECommerceStore:
     """
     BAD ARCHITECTURE: Directly calls Stripe API
@@ -32,13 +64,85 @@ class ECommerceStore:
     - Every Stripe API change breaks this code
     """
     
+    # Stripe keeps idempotency keys for 24 hours
+    IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+    IDEMPOTENCY_CACHE_SIZE = 50_000
+    
     def __init__(self):
         # Hard-coded Stripe configuration
         self.stripe_api_key = "sk_live_1234567890"
         self.stripe_base_url = "https://api.stripe.com/v1"
         self.stripe_webhook_secret = "whsec_1234567890"
+        self._auth_header = f"Bearer {self.stripe_api_key}"
+        self._default_headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json"
+        }
+        
+        # One pooled session for every Stripe call - keep-alive sockets mean
+        # back-to-back requests skip the TCP + TLS handshake. Created lazily
+        # because aiohttp sessions must be opened inside a running event loop.
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Stripe answers already seen, keyed by (operation, idempotency key)
+        # and stored with the request fingerprint, so client retries are
+        # answered locally instead of hitting Stripe again
+        self._idempotency_cache: OrderedDict[Tuple[str, str], Tuple[float, Tuple, Dict]] = OrderedDict()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared Stripe session, opening it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._default_headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=50)
+            )
+        return self._session
     
-    def checkout(self, cart_total: float, customer_info: Dict):
+    async def aclose(self):
+        """Close the shared Stripe session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _cached_result(self, operation: str, idempotency_key: Optional[str],
+                       fingerprint: Tuple) -> Optional[Dict]:
+        """
+        Return the stored result for this key if it has not expired.
+        
+        Reusing a key for a different request raises ValueError.
+        """
+        if idempotency_key is None:
+            return None
+        cache_key = (operation, idempotency_key)
+        entry = self._idempotency_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, stored_fingerprint, result = entry
+        if expires_at <= time.monotonic():
+            del self._idempotency_cache[cache_key]
+            return None
+        if stored_fingerprint != fingerprint:
+            raise ValueError(
+                f"Idempotency key {idempotency_key!r} reused with a different {operation} request"
+            )
+        return result
+    
+    def _remember_result(self, operation: str, idempotency_key: Optional[str],
+                         fingerprint: Tuple, result: Dict):
+        """Store a Stripe answer under its operation and idempotency key"""
+        if idempotency_key is None:
+            return
+        cache_key = (operation, idempotency_key)
+        self._idempotency_cache[cache_key] = (
+            time.monotonic() + self.IDEMPOTENCY_TTL_SECONDS, fingerprint, result
+        )
+        self._idempotency_cache.move_to_end(cache_key)
+        if len(self._idempotency_cache) > self.IDEMPOTENCY_CACHE_SIZE:
+            self._idempotency_cache.popitem(last=False)
+    
+    async def checkout(self, amount_cents: int, customer_info: Dict,
+                       idempotency_key: Optional[str] = None):
         """
         BAD: Directly calls Stripe API
         
@@ -47,59 +151,68 @@ class ECommerceStore:
         2. Can't switch to different provider
         3. Business logic mixed with API calls
         4. Error handling is Stripe-specific
+        
+        Reusing an idempotency key for a different charge raises ValueError.
         """
-        print(f"\n🛒 Processing checkout for ${cart_total}")
-        print(f"   Customer: {customer_info.get('name', 'Guest')}")
+        name = customer_info.get('name', 'Guest')
+        payment_method = customer_info.get('stripe_payment_method_id')
+        logger.info("🛒 Processing checkout for $%.2f (customer: %s)",
+                    amount_cents / 100, name)
+        
+        fingerprint = (amount_cents, payment_method)
+        cached = self._cached_result("checkout", idempotency_key, fingerprint)
+        if cached is not None:
+            logger.debug("↩️  Replaying result for idempotency key %s", idempotency_key)
+            return cached
         
         # BAD: Direct API call - tightly coupled!
         try:
-            response = requests.post(
+            async with self._get_session().post(
                 f"{self.stripe_base_url}/payment_intents",
-                headers={
-                    "Authorization": f"Bearer {self.stripe_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "amount": int(cart_total * 100),  # Stripe uses cents
-                    "currency": "usd",
-                    "payment_method": customer_info.get('stripe_payment_method_id'),
-                    "confirmation_method": "manual",
-                    "confirm": True
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            # BAD: Parsing Stripe-specific response
-            stripe_data = response.json()
+                data=orjson.dumps({
+                    **_CHECKOUT_TEMPLATE,
+                    "amount": amount_cents,  # Stripe uses cents
+                    "payment_method": payment_method
+                }),
+                headers=_idempotency_header("checkout", idempotency_key)
+            ) as response:
+                response.raise_for_status()
+                
+                # BAD: Parsing Stripe-specific response
+                stripe_data = orjson.loads(await response.read())
             transaction_id = stripe_data['id']
             status = stripe_data['status']
             
             if status == 'succeeded':
-                print(f"✅ Payment successful! Transaction: {transaction_id}")
-                return {
+                logger.info("✅ Payment successful! Transaction: %s", transaction_id)
+                result = {
                     'success': True,
                     'transaction_id': transaction_id,
                     'stripe_payment_intent_id': transaction_id,  # Stripe-specific!
                     'stripe_status': status  # Stripe-specific!
                 }
             else:
-                print(f"❌ Payment failed: {stripe_data.get('last_payment_error', {}).get('message', 'Unknown error')}")
-                return {
+                error = stripe_data.get('last_payment_error') or {}
+                message = error.get('message', 'Unknown error')
+                logger.warning("❌ Payment failed: %s", message)
+                result = {
                     'success': False,
-                    'error': stripe_data.get('last_payment_error', {}).get('message', 'Unknown error'),
-                    'stripe_error_code': stripe_data.get('last_payment_error', {}).get('code')  # Stripe-specific!
+                    'error': message,
+                    'stripe_error_code': error.get('code')  # Stripe-specific!
                 }
+            self._remember_result("checkout", idempotency_key, fingerprint, result)
+            return result
         
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             # BAD: Error handling is HTTP/Stripe-specific
-            print(f"❌ Stripe API error: {str(e)}")
+            logger.warning("❌ Stripe API error: %s", e)
             return {
                 'success': False,
                 'error': f"Stripe API error: {str(e)}"
             }
     
-    def refund(self, transaction_id: str, amount: Optional[float] = None):
+    async def refund(self, transaction_id: str, amount_cents: Optional[int] = None,
+                     idempotency_key: Optional[str] = None):
         """
         BAD: Direct Stripe API call for refunds
         
@@ -107,50 +220,75 @@ class ECommerceStore:
         1. Stripe-specific transaction ID format
         2. Stripe-specific refund API
         3. Can't refund PayPal transactions
+        
+        Reusing an idempotency key for a different refund raises ValueError.
         """
-        print(f"\n💰 Processing refund for transaction: {transaction_id}")
+        logger.info("💰 Processing refund for transaction: %s", transaction_id)
+        
+        fingerprint = (transaction_id, amount_cents)
+        cached = self._cached_result("refund", idempotency_key, fingerprint)
+        if cached is not None:
+            logger.debug("↩️  Replaying result for idempotency key %s", idempotency_key)
+            return cached
         
         # BAD: Stripe-specific refund endpoint
         try:
-            # First, get the payment intent
-            response = requests.get(
-                f"{self.stripe_base_url}/payment_intents/{transaction_id}",
-                headers={"Authorization": f"Bearer {self.stripe_api_key}"}
-            )
-            response.raise_for_status()
-            payment_intent = response.json()
-            
-            # Then create a refund
+            # Create the refund directly - Stripe validates the payment
+            # intent itself, so a separate GET would be a wasted round-trip
             refund_data = {
                 "payment_intent": transaction_id
             }
-            if amount:
-                refund_data["amount"] = int(amount * 100)  # Stripe uses cents
+            if amount_cents:
+                refund_data["amount"] = amount_cents  # Stripe uses cents
             
-            response = requests.post(
+            async with self._get_session().post(
                 f"{self.stripe_base_url}/refunds",
-                headers={
-                    "Authorization": f"Bearer {self.stripe_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json=refund_data
-            )
-            response.raise_for_status()
+                data=orjson.dumps(refund_data),
+                headers=_idempotency_header("refund", idempotency_key)
+            ) as response:
+                response.raise_for_status()
+                refund = orjson.loads(await response.read())
             
-            refund = response.json()
-            print(f"✅ Refund successful: {refund['id']}")
-            return {
+            logger.info("✅ Refund successful: %s", refund['id'])
+            result = {
                 'success': True,
                 'refund_id': refund['id'],
                 'stripe_refund_id': refund['id']  # Stripe-specific!
             }
+            self._remember_result("refund", idempotency_key, fingerprint, result)
+            return result
         
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Refund failed: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("❌ Refund failed: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
+    
+    # Legacy synchronous entry points. Each call spins up its own event loop,
+    # so the session is closed afterwards rather than leaked across loops.
+    
+    def checkout_sync(self, amount_cents: int, customer_info: Dict,
+                      idempotency_key: Optional[str] = None):
+        """Blocking wrapper around checkout() for legacy callers"""
+        return self._run_sync(
+            self.checkout(amount_cents, customer_info, idempotency_key)
+        )
+    
+    def refund_sync(self, transaction_id: str, amount_cents: Optional[int] = None,
+                    idempotency_key: Optional[str] = None):
+        """Blocking wrapper around refund() for legacy callers"""
+        return self._run_sync(
+            self.refund(transaction_id, amount_cents, idempotency_key)
+        )
+    
+    def _run_sync(self, coro):
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        return asyncio.run(runner())
 
 
 # ============================================================================
@@ -161,9 +299,9 @@ def demonstrate_bad_architecture():
     """
     Demonstrate the problems with no abstraction
     """
-    print("=" * 70)
+    print(_EQ70)
     print("BAD EXAMPLE 1: No Abstraction - Direct Coupling")
-    print("=" * 70)
+    print(_EQ70)
     print("\n❌ PROBLEMS WITH THIS ARCHITECTURE:")
     print("   1. Can't switch to PayPal without rewriting everything")
     print("   2. Can't test without real Stripe API (costs money!)")
@@ -171,9 +309,9 @@ def demonstrate_bad_architecture():
     print("   4. Every Stripe API change breaks this code")
     print("   5. Vendor lock-in - stuck with Stripe forever")
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Business wants to add PayPal")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     With this architecture, you would need to:
     
@@ -188,9 +326,9 @@ def demonstrate_bad_architecture():
     Result: 2-3 weeks of work, code duplication, maintenance nightmare!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Stripe raises their fees")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     Business wants to switch to cheaper provider.
     
@@ -204,23 +342,23 @@ def demonstrate_bad_architecture():
     Result: 3-6 months of work, $500k+ in costs, lost revenue during migration!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Testing")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     How do you test this code?
     
     Options:
     1. Use real Stripe API (costs money, slow, unreliable)
-    2. Mock requests library (complex, brittle)
+    2. Mock the aiohttp client (complex, brittle)
     3. Don't test (risky!)
     
     Result: Poor test coverage, bugs in production, expensive fixes!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("COMPARE TO: Good Architecture (example1_abstraction_and_interfaces.py)")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     With good architecture:
     
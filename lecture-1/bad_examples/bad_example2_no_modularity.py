@@ -13,10 +13,19 @@ PROBLEMS:
 5. Bugs affect everything
 """
 
-from typing import List, Dict, Optional
+from collections import Counter, OrderedDict, deque
+from typing import Deque, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+import itertools
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 class OrderStatus(Enum):
@@ -28,15 +37,38 @@ class OrderStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MenuItem:
     id: str
     name: str
-    price: float
+    price_cents: int  # integer cents - no float rounding
     category: str
     preparation_time: int
 
 
+class TicketState(Enum):
+    QUEUED = "queued"
+    PREPARING = "preparing"
+
+
+@dataclass(slots=True)
+class KitchenTicket:
+    order_id: str
+    items: List[MenuItem]
+    prep_time: int
+    customer_name: str
+    state: TicketState = TicketState.QUEUED
+
+
+# BAD: Inventory recipe data lives next to the order system
+_INGREDIENTS: Dict[str, Tuple[str, ...]] = {
+    "burger": ("beef_patty", "bun", "lettuce", "tomato", "cheese"),
+    "fries": ("potato",),
+    "salad": ("lettuce", "tomato"),
+    "drink": (),  # No ingredients needed
+}
+
+
 # ============================================================================
 # BAD: Everything in one giant class - "God Object" anti-pattern
 # ============================================================================
@@ -59,14 +91,19 @@ class RestaurantSystem:
     6. Can't scale individual components
     """
     
+    # Keep memory bounded in a long-running process - oldest entries go first
+    MAX_ORDERS = 100_000
+    MAX_NOTIFICATIONS = 10_000
+    
     def __init__(self):
         # BAD: All data mixed together
-        self.orders: Dict[str, Dict] = {}
+        self.orders: OrderedDict[str, Dict] = OrderedDict()
+        self._next_order_id = itertools.count(1)
         self.menu: Dict[str, MenuItem] = {
-            "burger": MenuItem("burger", "Classic Burger", 12.99, "main", 15),
-            "fries": MenuItem("fries", "French Fries", 4.99, "side", 5),
-            "salad": MenuItem("salad", "Caesar Salad", 8.99, "main", 10),
-            "drink": MenuItem("drink", "Soft Drink", 2.99, "beverage", 2),
+            "burger": MenuItem("burger", "Classic Burger", 1299, "main", 15),
+            "fries": MenuItem("fries", "French Fries", 499, "side", 5),
+            "salad": MenuItem("salad", "Caesar Salad", 899, "main", 10),
+            "drink": MenuItem("drink", "Soft Drink", 299, "beverage", 2),
         }
         self.stock: Dict[str, int] = {
             "beef_patty": 50,
@@ -76,12 +113,13 @@ class RestaurantSystem:
             "cheese": 40,
             "potato": 200,
         }
-        self.kitchen_queue: List[Dict] = []
-        self.preparing: Dict[str, Dict] = {}
+        # Queued and in-progress kitchen work share one map; each ticket
+        # carries its own state, so every lookup/removal is a single O(1) op
+        self._tickets: OrderedDict[str, KitchenTicket] = OrderedDict()
         self.customers: Dict[str, Dict] = {}
-        self.payments: Dict[str, Dict] = {}
-        self.analytics: Dict[str, int] = {}
-        self.notifications: List[Dict] = []
+        self.payments: OrderedDict[str, Dict] = OrderedDict()
+        self.analytics: Counter[str] = Counter()
+        self.notifications: Deque[Dict] = deque(maxlen=self.MAX_NOTIFICATIONS)
         # ... 50 more data structures
     
     def place_order(self, customer_name: str, item_ids: List[str]) -> Optional[Dict]:
@@ -100,122 +138,227 @@ class RestaurantSystem:
         
         Can't test one without testing all!
         """
-        print(f"\n{'='*70}")
-        print(f"🛒 Processing order for {customer_name}")
-        print(f"{'='*70}")
+        now = datetime.now()  # one clock read shared by every record below
+        logger.info("🛒 Processing order for %s", customer_name)
+        
+        resolved = self._resolve_items(item_ids)
+        if resolved is None:
+            return None
+        items, total_cents, prep_time, needed = resolved
+        
+        # Check the whole order at once so nothing is touched on failure
+        for ingredient, quantity in needed.items():
+            if self.stock.get(ingredient, 0) < quantity:
+                logger.warning("❌ Cannot fulfill order: %s out of stock", ingredient)
+                return None
+        
+        # BAD: Inventory updates mixed with order processing
+        for ingredient, quantity in needed.items():
+            self.stock[ingredient] -= quantity
+            logger.debug("📦 Used %dx %s", quantity, ingredient)
+        
+        order = self._record_order(customer_name, items, total_cents, prep_time, now)
+        order_id = order['id']
+        
+        # BAD: Notifications mixed with order processing
+        notification = {
+            'customer': customer_name,
+            'message': f"Order {order_id} confirmed! Total: ${total_cents / 100:.2f}",
+            'sent_at': now
+        }
+        self.notifications.append(notification)
+        logger.info("📱 Notified %s: %s", customer_name, notification['message'])
+        
+        # BAD: Analytics mixed with order processing
+        self.analytics['total_orders'] += 1
+        self.analytics['total_revenue_cents'] += total_cents
+        self.analytics.update(f'{item.category}_orders' for item in items)
+        
+        order['status'] = OrderStatus.CONFIRMED.value
+        logger.info("✅ Order %s confirmed!", order_id)
+        
+        return order
+    
+    def place_orders(self, order_requests: List[Tuple[str, List[str]]]) -> List[Optional[Dict]]:
+        """
+        Place many orders in one pass (e.g. catering imports).
+        
+        Ingredient needs for every valid order are summed into one Counter
+        and checked against stock once. If stock cannot cover the whole
+        batch, nothing is placed. Orders with unknown items get None.
+        Notifications and analytics are applied in bulk.
+        """
+        now = datetime.now()
+        logger.info("🛒 Processing batch of %d orders", len(order_requests))
+        
+        resolved = [self._resolve_items(item_ids) for _, item_ids in order_requests]
+        total_needed = Counter()
+        for entry in resolved:
+            if entry is not None:
+                total_needed.update(entry[3])
+        
+        for ingredient, quantity in total_needed.items():
+            if self.stock.get(ingredient, 0) < quantity:
+                logger.warning("❌ Cannot fulfill batch: %s out of stock", ingredient)
+                return [None] * len(order_requests)
+        
+        for ingredient, quantity in total_needed.items():
+            self.stock[ingredient] -= quantity
+            logger.debug("📦 Used %dx %s", quantity, ingredient)
+        
+        results: List[Optional[Dict]] = []
+        for (customer_name, _), entry in zip(order_requests, resolved):
+            if entry is None:
+                results.append(None)
+                continue
+            items, total_cents, prep_time, _ = entry
+            results.append(
+                self._record_order(customer_name, items, total_cents, prep_time, now)
+            )
         
-        # BAD: Inventory logic mixed with order logic
+        placed = [order for order in results if order is not None]
+        self.notifications.extend(
+            {
+                'customer': order['customer_name'],
+                'message': f"Order {order['id']} confirmed! Total: ${order['total_cents'] / 100:.2f}",
+                'sent_at': now
+            }
+            for order in placed
+        )
+        self.analytics['total_orders'] += len(placed)
+        self.analytics['total_revenue_cents'] += sum(order['total_cents'] for order in placed)
+        self.analytics.update(
+            f'{item.category}_orders' for order in placed for item in order['items']
+        )
+        for order in placed:
+            order['status'] = OrderStatus.CONFIRMED.value
+        logger.info("✅ Confirmed %d of %d orders", len(placed), len(order_requests))
+        
+        return results
+    
+    def _resolve_items(self, item_ids: List[str]) -> Optional[Tuple[List[MenuItem], int, int, Counter]]:
+        """
+        BAD: Inventory logic mixed with order logic
+        
+        One pass validates items and gathers the item list, total, prep
+        time and ingredient needs together. Returns None on an unknown item.
+        """
+        needed = Counter()
+        items = []
+        total_cents = 0
+        prep_time = 0
         for item_id in item_ids:
-            if item_id not in self.menu:
-                print(f"❌ Invalid item: {item_id}")
+            item = self.menu.get(item_id)
+            if item is None:
+                logger.warning("❌ Invalid item: %s", item_id)
                 return None
+            items.append(item)
+            total_cents += item.price_cents
+            if item.preparation_time > prep_time:
+                prep_time = item.preparation_time
             
             # BAD: Complex ingredient checking logic embedded here
-            required_ingredients = self._get_ingredients_for_item(item_id)
-            for ingredient in required_ingredients:
-                if self.stock.get(ingredient, 0) < 1:
-                    print(f"❌ Cannot fulfill order: {ingredient} out of stock")
-                    return None
-        
+            needed.update(self._get_ingredients_for_item(item_id))
+        return items, total_cents, prep_time, needed
+    
+    def _record_order(self, customer_name: str, items: List[MenuItem],
+                      total_cents: int, prep_time: int, now: datetime) -> Dict:
+        """BAD: Order, kitchen, customer and payment records written together"""
         # BAD: Order creation logic mixed with everything else
-        order_id = f"ORD-{len(self.orders) + 1:04d}"
-        items = [self.menu[item_id] for item_id in item_ids]
-        total = sum(item.price for item in items)
+        order_id = f"ORD-{next(self._next_order_id):04d}"
         
         order = {
             'id': order_id,
             'customer_name': customer_name,
             'items': items,
             'status': OrderStatus.PENDING.value,
-            'created_at': datetime.now(),
-            'total': total
+            'created_at': now,
+            'total_cents': total_cents
         }
-        self.orders[order_id] = order
-        
-        # BAD: Inventory updates mixed with order processing
-        for item_id in item_ids:
-            ingredients = self._get_ingredients_for_item(item_id)
-            for ingredient in ingredients:
-                self.stock[ingredient] = max(0, self.stock[ingredient] - 1)
-                print(f"📦 Used {ingredient}")
+        evicted = self._store_bounded(self.orders, order_id, order)
+        if evicted is not None:
+            self._forget_order(*evicted)
         
         # BAD: Kitchen management mixed with order processing
-        prep_time = max(item.preparation_time for item in items)
-        self.kitchen_queue.append({
-            'order_id': order_id,
-            'items': items,
-            'prep_time': prep_time,
-            'customer_name': customer_name
-        })
-        print(f"👨‍🍳 Sent order {order_id} to kitchen (est. {prep_time} min)")
+        self._tickets[order_id] = KitchenTicket(
+            order_id=order_id,
+            items=items,
+            prep_time=prep_time,
+            customer_name=customer_name
+        )
+        logger.info("👨‍🍳 Sent order %s to kitchen (est. %d min)", order_id, prep_time)
         
         # BAD: Customer management mixed with order processing
-        if customer_name not in self.customers:
-            self.customers[customer_name] = {
+        customer = self.customers.get(customer_name)
+        if customer is None:
+            customer = {
                 'orders': [],
-                'total_spent': 0.0,
-                'first_order_date': datetime.now()
+                'total_spent_cents': 0,
+                'first_order_date': now
             }
-        self.customers[customer_name]['orders'].append(order_id)
-        self.customers[customer_name]['total_spent'] += total
-        
-        # BAD: Notifications mixed with order processing
-        notification = {
-            'customer': customer_name,
-            'message': f"Order {order_id} confirmed! Total: ${total:.2f}",
-            'sent_at': datetime.now()
-        }
-        self.notifications.append(notification)
-        print(f"📱 Notified {customer_name}: {notification['message']}")
-        
-        # BAD: Analytics mixed with order processing
-        self.analytics['total_orders'] = self.analytics.get('total_orders', 0) + 1
-        self.analytics['total_revenue'] = self.analytics.get('total_revenue', 0.0) + total
-        for item in items:
-            category = item.category
-            self.analytics[f'{category}_orders'] = self.analytics.get(f'{category}_orders', 0) + 1
+            self.customers[customer_name] = customer
+        customer['orders'].append(order_id)
+        customer['total_spent_cents'] += total_cents
         
         # BAD: Payment processing mixed with order processing
         payment = {
             'order_id': order_id,
-            'amount': total,
+            'amount_cents': total_cents,
             'status': 'pending',
-            'created_at': datetime.now()
+            'created_at': now
         }
-        self.payments[order_id] = payment
-        
-        order['status'] = OrderStatus.CONFIRMED.value
-        print(f"✅ Order {order_id} confirmed!")
+        self._store_bounded(self.payments, order_id, payment)
         
         return order
     
-    def _get_ingredients_for_item(self, item_id: str) -> List[str]:
+    def _store_bounded(self, store: OrderedDict, key: str,
+                       value: Dict) -> Optional[Tuple[str, Dict]]:
+        """Insert a record, evicting and returning the oldest one beyond MAX_ORDERS"""
+        store[key] = value
+        if len(store) > self.MAX_ORDERS:
+            return store.popitem(last=False)
+        return None
+    
+    def _forget_order(self, order_id: str, order: Dict):
+        """
+        BAD: Evicting an order has to clean up kitchen and customer data too.
+        
+        Customer history and spend track the stored orders. self.analytics
+        is deliberately left alone: its order and revenue totals are
+        lifetime counters that outlive eviction.
+        """
+        self._tickets.pop(order_id, None)
+        customer_name = order['customer_name']
+        customer = self.customers.get(customer_name)
+        if customer is not None:
+            # Orders are recorded oldest first, so this finds it at index 0
+            customer['orders'].remove(order_id)
+            customer['total_spent_cents'] -= order['total_cents']
+            if not customer['orders']:
+                del self.customers[customer_name]
+    
+    def _get_ingredients_for_item(self, item_id: str) -> Tuple[str, ...]:
         """BAD: Helper method that should be in InventoryManager"""
-        required_ingredients = {
-            "burger": ["beef_patty", "bun", "lettuce", "tomato", "cheese"],
-            "fries": ["potato"],
-            "salad": ["lettuce", "tomato"],
-            "drink": []  # No ingredients needed
-        }
-        return required_ingredients.get(item_id, [])
+        return _INGREDIENTS.get(item_id, ())
+    
+    def start_preparing(self, order_id: str):
+        """BAD: Kitchen scheduling in order system"""
+        ticket = self._tickets.get(order_id)
+        if ticket is not None and ticket.state is TicketState.QUEUED:
+            ticket.state = TicketState.PREPARING
+            order = self.orders.get(order_id)
+            if order is not None:
+                order['status'] = OrderStatus.PREPARING.value
     
     def complete_order(self, order_id: str):
         """BAD: More mixed responsibilities"""
-        if order_id not in self.orders:
-            print(f"❌ Order {order_id} not found")
-            return
-        
-        order = self.orders[order_id]
-        
         # BAD: Kitchen logic mixed with order completion
-        if order_id in self.preparing:
-            del self.preparing[order_id]
-        else:
-            # Find in queue
-            for i, queued_order in enumerate(self.kitchen_queue):
-                if queued_order['order_id'] == order_id:
-                    self.kitchen_queue.pop(i)
-                    break
+        self._tickets.pop(order_id, None)
+        
+        order = self.orders.get(order_id)
+        if order is None:
+            logger.warning("❌ Order %s not found", order_id)
+            return
         
         # BAD: Order status update mixed with notifications
         order['status'] = OrderStatus.READY.value
@@ -227,7 +370,7 @@ class RestaurantSystem:
             'sent_at': datetime.now()
         }
         self.notifications.append(notification)
-        print(f"📱 Notified {order['customer_name']}: {notification['message']}")
+        logger.info("📱 Notified %s: %s", order['customer_name'], notification['message'])
         
         # BAD: Payment update mixed with order completion
         if order_id in self.payments:
@@ -256,9 +399,9 @@ def demonstrate_bad_architecture():
     """
     Demonstrate the problems with no modularity
     """
-    print("=" * 70)
+    print(_EQ70)
     print("BAD EXAMPLE 2: No Modularity - Monolithic Spaghetti")
-    print("=" * 70)
+    print(_EQ70)
     print("\n❌ PROBLEMS WITH THIS ARCHITECTURE:")
     print("   1. Can't test order creation without setting up entire system")
     print("   2. Can't reuse inventory logic in warehouse system")
@@ -267,9 +410,9 @@ def demonstrate_bad_architecture():
     print("   5. Can't scale individual components")
     print("   6. 2000+ lines of code in one file = unmaintainable")
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Testing Order Creation")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     To test place_order(), you need to:
     1. Set up menu items
@@ -283,9 +426,9 @@ def demonstrate_bad_architecture():
     Result: Test setup takes 50+ lines, tests are slow, fragile!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Team Development")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     Team of 5 developers working on different features:
     - Developer A: Adding inventory features
@@ -299,9 +442,9 @@ def demonstrate_bad_architecture():
     Result: Constant merge conflicts, blocking each other, slow development!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Reusing Inventory Logic")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     New requirement: Warehouse management system needs inventory tracking.
     
@@ -314,9 +457,9 @@ def demonstrate_bad_architecture():
     Result: Code duplication, maintenance nightmare, inconsistent behavior!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Scaling")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     Business grows: Need to scale kitchen operations.
     
@@ -329,9 +472,9 @@ def demonstrate_bad_architecture():
     Result: Expensive scaling, wasted resources, poor performance!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("COMPARE TO: Good Architecture (example2_modularity_and_components.py)")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     With good architecture:
     
@@ -13,9 +13,19 @@ implementation details and exposing only what's necessary.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+import itertools
+import logging
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 # ============================================================================
@@ -26,15 +36,15 @@ from enum import Enum
 # code to any specific implementation. This is where abstraction shines!
 
 
-class PaymentStatus(Enum):
+class PaymentStatus(IntEnum):
     """Payment status enumeration"""
-    PENDING = "pending"
-    SUCCESS = "success"
-    FAILED = "failed"
-    REFUNDED = "refunded"
+    PENDING = 0
+    SUCCESS = 1
+    FAILED = 2
+    REFUNDED = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentResult:
     """Result of a payment operation"""
     status: PaymentStatus
@@ -113,7 +123,70 @@ class PaymentProcessor(ABC):
 # different payment providers. The client code doesn't need to know about
 # API keys, HTTP requests, webhooks, etc.
 
-class StripePaymentProcessor(PaymentProcessor):
+# Once a payment reaches one of these states it never changes again
+TERMINAL_STATUSES = frozenset({
+    PaymentStatus.SUCCESS,
+    PaymentStatus.FAILED,
+    PaymentStatus.REFUNDED,
+})
+
+
+# Oldest simulated transactions are evicted beyond this many per processor
+MAX_TRANSACTIONS = 100_000
+
+
+def _store_bounded(store: OrderedDict, key: str, value, max_size: int):
+    """Insert into an OrderedDict, evicting the oldest entry when full"""
+    store[key] = value
+    if len(store) > max_size:
+        store.popitem(last=False)
+
+
+class PaymentStatusCacheMixin(ABC):
+    """
+    Caches get_payment_status lookups in front of the provider API.
+    
+    Terminal statuses are immutable, so they are kept forever. Anything
+    else (e.g. PENDING) is cached for a short TTL and then re-fetched.
+    Subclasses implement _fetch_payment_status() with the real lookup.
+    """
+    
+    STATUS_TTL_SECONDS = 30.0
+    STATUS_CACHE_SIZE = 10_000
+    
+    def _init_status_cache(self):
+        self._terminal_cache: Dict[str, PaymentStatus] = {}
+        self._status_cache: OrderedDict[str, Tuple[float, PaymentStatus]] = OrderedDict()
+    
+    @abstractmethod
+    def _fetch_payment_status(self, transaction_id: str) -> PaymentStatus:
+        """Look up the status at the provider (uncached)"""
+        pass
+    
+    def get_payment_status(self, transaction_id: str) -> PaymentStatus:
+        """Get payment status, hitting the provider only on a cache miss"""
+        status = self._terminal_cache.get(transaction_id)
+        if status is not None:
+            return status
+        
+        now = time.monotonic()
+        entry = self._status_cache.get(transaction_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        status = self._fetch_payment_status(transaction_id)
+        if status in TERMINAL_STATUSES:
+            self._terminal_cache[transaction_id] = status
+            self._status_cache.pop(transaction_id, None)
+        else:
+            self._status_cache[transaction_id] = (now + self.STATUS_TTL_SECONDS, status)
+            self._status_cache.move_to_end(transaction_id)
+            if len(self._status_cache) > self.STATUS_CACHE_SIZE:
+                self._status_cache.popitem(last=False)
+        return status
+
+
+class StripePaymentProcessor(PaymentStatusCacheMixin, PaymentProcessor):
     """
     Stripe payment processor implementation.
     
@@ -126,23 +199,25 @@ class StripePaymentProcessor(PaymentProcessor):
     
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self._transactions = {}  # Simulated transaction storage
+        self._transactions: OrderedDict[str, Dict] = OrderedDict()  # Simulated transaction storage
+        self._next_id = itertools.count(1)
+        self._init_status_cache()
     
     def process_payment(self, amount: float, currency: str, 
                       customer_info: Dict) -> PaymentResult:
         """Process payment via Stripe API"""
         # In reality, this would make HTTP calls to Stripe
         # Here we simulate the complexity being hidden
-        print(f"  [Stripe] Authenticating with API key: {self.api_key[:10]}...")
-        print(f"  [Stripe] Creating payment intent for ${amount} {currency}")
-        print(f"  [Stripe] Processing card ending in {customer_info.get('card_last4', '****')}")
+        logger.info("  [Stripe] Authenticating with API key: %s...", self.api_key[:10])
+        logger.info("  [Stripe] Creating payment intent for $%s %s", amount, currency)
+        logger.info("  [Stripe] Processing card ending in %s", customer_info.get('card_last4', '****'))
         
         # Simulate API call
-        transaction_id = f"stripe_{len(self._transactions) + 1}"
-        self._transactions[transaction_id] = {
+        transaction_id = f"stripe_{next(self._next_id)}"
+        _store_bounded(self._transactions, transaction_id, {
             'amount': amount,
             'status': PaymentStatus.SUCCESS
-        }
+        }, MAX_TRANSACTIONS)
         
         return PaymentResult(
             status=PaymentStatus.SUCCESS,
@@ -154,7 +229,7 @@ class StripePaymentProcessor(PaymentProcessor):
     def refund_payment(self, transaction_id: str, 
                       amount: Optional[float] = None) -> PaymentResult:
         """Refund payment via Stripe API"""
-        print(f"  [Stripe] Processing refund for {transaction_id}")
+        logger.info("  [Stripe] Processing refund for %s", transaction_id)
         if transaction_id in self._transactions:
             refund_amount = amount or self._transactions[transaction_id]['amount']
             return PaymentResult(
@@ -168,12 +243,12 @@ class StripePaymentProcessor(PaymentProcessor):
             message="Transaction not found"
         )
     
-    def get_payment_status(self, transaction_id: str) -> PaymentStatus:
+    def _fetch_payment_status(self, transaction_id: str) -> PaymentStatus:
         """Get payment status from Stripe"""
         return self._transactions.get(transaction_id, {}).get('status', PaymentStatus.PENDING)
 
 
-class PayPalPaymentProcessor(PaymentProcessor):
+class PayPalPaymentProcessor(PaymentStatusCacheMixin, PaymentProcessor):
     """
     PayPal payment processor implementation.
     
@@ -184,21 +259,23 @@ class PayPalPaymentProcessor(PaymentProcessor):
     def __init__(self, client_id: str, client_secret: str):
         self.client_id = client_id
         self.client_secret = client_secret
-        self._transactions = {}
+        self._transactions: OrderedDict[str, Dict] = OrderedDict()
+        self._next_id = itertools.count(1)
+        self._init_status_cache()
     
     def process_payment(self, amount: float, currency: str, 
                       customer_info: Dict) -> PaymentResult:
         """Process payment via PayPal API"""
-        print(f"  [PayPal] Authenticating with OAuth2...")
-        print(f"  [PayPal] Creating order for ${amount} {currency}")
-        print(f"  [PayPal] Redirecting to PayPal checkout...")
+        logger.info("  [PayPal] Authenticating with OAuth2...")
+        logger.info("  [PayPal] Creating order for $%s %s", amount, currency)
+        logger.info("  [PayPal] Redirecting to PayPal checkout...")
         
         # Different API, different flow, but same interface!
-        transaction_id = f"paypal_{len(self._transactions) + 1}"
-        self._transactions[transaction_id] = {
+        transaction_id = f"paypal_{next(self._next_id)}"
+        _store_bounded(self._transactions, transaction_id, {
             'amount': amount,
             'status': PaymentStatus.SUCCESS
-        }
+        }, MAX_TRANSACTIONS)
         
         return PaymentResult(
             status=PaymentStatus.SUCCESS,
@@ -210,7 +287,7 @@ class PayPalPaymentProcessor(PaymentProcessor):
     def refund_payment(self, transaction_id: str, 
                       amount: Optional[float] = None) -> PaymentResult:
         """Refund payment via PayPal API"""
-        print(f"  [PayPal] Processing refund for {transaction_id}")
+        logger.info("  [PayPal] Processing refund for %s", transaction_id)
         if transaction_id in self._transactions:
             refund_amount = amount or self._transactions[transaction_id]['amount']
             return PaymentResult(
@@ -224,11 +301,67 @@ class PayPalPaymentProcessor(PaymentProcessor):
             message="Transaction not found"
         )
     
-    def get_payment_status(self, transaction_id: str) -> PaymentStatus:
+    def _fetch_payment_status(self, transaction_id: str) -> PaymentStatus:
         """Get payment status from PayPal"""
         return self._transactions.get(transaction_id, {}).get('status', PaymentStatus.PENDING)
 
 
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # calls go through
+    OPEN = "open"            # calls fail fast until the cooldown passes
+    HALF_OPEN = "half_open"  # one trial call decides whether to close again
+
+
+# Returned instead of calling a provider while its circuit is open
+CIRCUIT_OPEN_RESULT = PaymentResult(
+    status=PaymentStatus.FAILED,
+    message="Payment provider unavailable (circuit open)"
+)
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Fails fast while a payment provider keeps erroring.
+    
+    After `threshold` consecutive exceptions the circuit opens and calls
+    return CIRCUIT_OPEN_RESULT immediately. Once `cooldown` seconds pass,
+    one trial call is let through: success closes the circuit again,
+    failure re-opens it.
+    """
+    threshold: int = 5
+    cooldown: float = 10.0
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    opened_at: float = 0.0
+    
+    def call(self, operation: Callable[[], PaymentResult]) -> PaymentResult:
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN:
+            if now - self.opened_at < self.cooldown:
+                return CIRCUIT_OPEN_RESULT
+            self.state = CircuitState.HALF_OPEN
+        
+        try:
+            result = operation()
+        except Exception:
+            self._on_failure(now)
+            raise
+        self._on_success()
+        return result
+    
+    def _on_success(self):
+        self.failure_count = 0
+        self.state = CircuitState.CLOSED
+    
+    def _on_failure(self, now: float):
+        self.failure_count += 1
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.threshold:
+            self.state = CircuitState.OPEN
+            self.opened_at = now
+
+
 # ============================================================================
 # CLIENT CODE: Uses Abstraction
 # ============================================================================
@@ -245,41 +378,67 @@ class ECommerceStore:
     - The complexity is hidden behind the interface
     """
     
+    # Oldest idempotency keys are forgotten beyond this many
+    IDEMPOTENCY_CACHE_SIZE = 100_000
+    
     def __init__(self, payment_processor: PaymentProcessor):
         """
         Dependency Injection: We inject the payment processor.
         This makes the system flexible and testable.
         """
         self.payment_processor = payment_processor
+        self.breaker = CircuitBreaker()
+        # idempotency key -> (request fingerprint, result), so client
+        # retries are answered without charging the customer twice
+        self._idempotency_cache: OrderedDict[str, Tuple[Tuple, PaymentResult]] = OrderedDict()
     
-    def checkout(self, cart_total: float, customer_info: Dict) -> PaymentResult:
+    def checkout(self, cart_total: float, customer_info: Dict,
+                 idempotency_key: Optional[str] = None) -> PaymentResult:
         """
         Process checkout using the payment processor.
         
         Notice: This method doesn't care if it's Stripe, PayPal, or any
         other provider. It just uses the interface!
+        
+        Retrying with the same idempotency_key returns the original result.
+        Reusing a key for a different cart or customer raises ValueError.
         """
-        print(f"\n🛒 Processing checkout for ${cart_total}")
-        print(f"   Customer: {customer_info.get('name', 'Guest')}")
+        logger.info("\n🛒 Processing checkout for $%s", cart_total)
+        logger.info("   Customer: %s", customer_info.get('name', 'Guest'))
         
-        result = self.payment_processor.process_payment(
+        if idempotency_key is not None:
+            fingerprint = (cart_total, tuple(sorted(customer_info.items())))
+            entry = self._idempotency_cache.get(idempotency_key)
+            if entry is not None:
+                if entry[0] != fingerprint:
+                    raise ValueError(
+                        f"Idempotency key {idempotency_key!r} reused with a different request"
+                    )
+                logger.info("↩️  Replaying result for idempotency key %s", idempotency_key)
+                return entry[1]
+        
+        result = self.breaker.call(lambda: self.payment_processor.process_payment(
             amount=cart_total,
             currency="USD",
             customer_info=customer_info
-        )
+        ))
         
         if result.status == PaymentStatus.SUCCESS:
-            print(f"✅ Payment successful! Transaction: {result.transaction_id}")
+            logger.info("✅ Payment successful! Transaction: %s", result.transaction_id)
         else:
-            print(f"❌ Payment failed: {result.message}")
+            logger.warning("❌ Payment failed: %s", result.message)
         
+        # A fail-fast answer is not a real outcome, so a retry must try again
+        if idempotency_key is not None and result is not CIRCUIT_OPEN_RESULT:
+            _store_bounded(self._idempotency_cache, idempotency_key,
+                           (fingerprint, result), self.IDEMPOTENCY_CACHE_SIZE)
         return result
     
     def process_refund(self, transaction_id: str, amount: Optional[float] = None):
         """Process a refund"""
-        print(f"\n💰 Processing refund for transaction: {transaction_id}")
+        logger.info("\n💰 Processing refund for transaction: %s", transaction_id)
         result = self.payment_processor.refund_payment(transaction_id, amount)
-        print(f"   Result: {result.message}")
+        logger.info("   Result: %s", result.message)
         return result
 
 
@@ -292,18 +451,21 @@ def demonstrate_abstraction():
     Demonstrate how abstraction allows us to swap implementations
     without changing client code.
     """
-    print("=" * 70)
+    # Components log instead of printing; the demo shows those messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    print(_EQ70)
     print("EXAMPLE 1: Abstraction and Interfaces in Software Architecture")
-    print("=" * 70)
+    print(_EQ70)
     print("\n📚 Key Concepts:")
     print("   • Abstraction hides implementation complexity")
     print("   • Interfaces define contracts between components")
     print("   • Clients depend on interfaces, not implementations")
     print("   • This enables flexibility and maintainability")
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO 1: Using Stripe Payment Processor")
-    print("=" * 70)
+    print(_EQ70)
     
     # Create Stripe processor (hides all Stripe API complexity)
     stripe = StripePaymentProcessor(api_key="sk_live_1234567890")
@@ -319,9 +481,9 @@ def demonstrate_abstraction():
         }
     )
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO 2: Switching to PayPal (No Code Changes!)")
-    print("=" * 70)
+    print(_EQ70)
     
     # Switch to PayPal - just change the processor!
     # The ECommerceStore code doesn't need to change at all!
@@ -340,9 +502,9 @@ def demonstrate_abstraction():
         }
     )
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("KEY INSIGHT: Architecture Enables Flexibility")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     By using abstraction and interfaces:
     
@@ -355,9 +517,9 @@ def demonstrate_abstraction():
     This is the power of good software architecture!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("REAL-WORLD BUSINESS BENEFITS")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     In a real e-commerce business:
     
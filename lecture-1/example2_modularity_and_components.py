@@ -12,11 +12,25 @@ Key Concept: Modularity allows us to build complex systems by composing
 smaller, independent, reusable components.
 """
 
-from typing import List, Dict, Optional
+from collections import Counter, deque
+from typing import Deque, Final, List, Dict, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+import asyncio
+import itertools
 import json
+import logging
+import sys
+
+# Log with lazy %-style arguments; guard with isEnabledFor only where an
+# argument has to be built first (e.g. a join over the order's items)
+logger = logging.getLogger(__name__)
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 # ============================================================================
@@ -33,19 +47,18 @@ import json
 # independently!
 
 
-class OrderStatus(Enum):
+class OrderStatus(IntEnum):
     """Order status enumeration"""
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    PREPARING = "preparing"
-    READY = "ready"
-    DELIVERED = "delivered"
-    CANCELLED = "cancelled"
+    PENDING = 0
+    CONFIRMED = 1
+    PREPARING = 2
+    READY = 3
+    DELIVERED = 4
+    CANCELLED = 5
 
 
-@dataclass
-class MenuItem:
-    """Represents a menu item"""
+class MenuItem(NamedTuple):
+    """Represents a menu item (immutable, read on every order)"""
     id: str
     name: str
     price: float
@@ -53,7 +66,7 @@ class MenuItem:
     preparation_time: int  # minutes
 
 
-@dataclass
+@dataclass(slots=True)  # not frozen: status changes over the order lifecycle
 class Order:
     """Represents a customer order"""
     id: str
@@ -64,6 +77,22 @@ class Order:
     total: float
 
 
+@lru_cache(maxsize=4096)
+def _cart_total(items: Tuple[MenuItem, ...]) -> float:
+    """
+    Total price of a cart; popular combos are answered from the cache.
+    
+    Callers pass the items sorted by id, so the same combo in any order
+    shares one cache entry (and one float sum).
+    """
+    return sum(item.price for item in items)
+
+
+def _to_cents(amount: float) -> int:
+    """Dollar amount as whole cents, for exact running sums"""
+    return round(amount * 100)
+
+
 # ============================================================================
 # MODULE 1: Order Management Component
 # ============================================================================
@@ -83,6 +112,11 @@ class OrderManager:
     
     def __init__(self):
         self.orders: Dict[str, Order] = {}
+        self._order_seq = itertools.count(1)
+        # Running sum of order totals per status in integer cents (floats
+        # would drift as totals move between statuses), kept in step with
+        # self.orders
+        self._cents_by_status: Counter = Counter()
         self.menu: Dict[str, MenuItem] = {
             "burger": MenuItem("burger", "Classic Burger", 12.99, "main", 15),
             "fries": MenuItem("fries", "French Fries", 4.99, "side", 5),
@@ -90,33 +124,56 @@ class OrderManager:
             "drink": MenuItem("drink", "Soft Drink", 2.99, "beverage", 2),
         }
     
-    def create_order(self, customer_name: str, item_ids: List[str]) -> Order:
-        """Create a new order"""
-        order_id = f"ORD-{len(self.orders) + 1:04d}"
-        items = [self.menu[item_id] for item_id in item_ids if item_id in self.menu]
+    def create_order(self, customer_name: str, item_ids: List[str],
+                     created_at: Optional[datetime] = None) -> Order:
+        """Create a new order (created_at defaults to now)"""
+        order_id = f"ORD-{next(self._order_seq):04d}"
+        
+        # One menu lookup per item; unknown ids are skipped
+        menu = self.menu
+        items = [item for item_id in item_ids
+                 if (item := menu.get(item_id)) is not None]
+        total = _cart_total(tuple(sorted(items, key=attrgetter("id"))))
         
         order = Order(
             id=order_id,
             customer_name=customer_name,
             items=items,
             status=OrderStatus.PENDING,
-            created_at=datetime.now(),
-            total=sum(item.price for item in items)
+            created_at=created_at or datetime.now(),
+            total=total
         )
         
         self.orders[order_id] = order
-        print(f"📝 [OrderManager] Created order {order_id} for {customer_name}")
+        self._cents_by_status[OrderStatus.PENDING] += _to_cents(total)
+        logger.info("📝 [OrderManager] Created order %s for %s", order_id, customer_name)
         return order
     
+    def create_orders_batch(self, specs: List[Tuple[str, List[str]]]) -> List[Order]:
+        """Create several orders that share one creation timestamp"""
+        now = datetime.now()
+        return [
+            self.create_order(customer_name, item_ids, created_at=now)
+            for customer_name, item_ids in specs
+        ]
+    
     def update_order_status(self, order_id: str, status: OrderStatus):
         """Update order status"""
-        if order_id in self.orders:
-            self.orders[order_id].status = status
-            print(f"📝 [OrderManager] Order {order_id} status: {status.value}")
+        order = self.orders.get(order_id)
+        if order is not None:
+            cents = _to_cents(order.total)
+            self._cents_by_status[order.status] -= cents
+            self._cents_by_status[status] += cents
+            order.status = status
+            logger.info("📝 [OrderManager] Order %s status: %s", order_id, status.name.lower())
     
     def get_order(self, order_id: str) -> Optional[Order]:
         """Get order by ID"""
         return self.orders.get(order_id)
+    
+    def sum_totals_by_status(self, status: OrderStatus) -> float:
+        """Total value of all orders currently in the given status"""
+        return self._cents_by_status[status] / 100
 
 
 # ============================================================================
@@ -140,33 +197,54 @@ class KitchenManager:
     """
     
     def __init__(self):
-        self.prep_queue: List[Order] = []
+        self.prep_queue: Deque[Order] = deque()
         self.preparing: Dict[str, Order] = {}
     
     def receive_order(self, order: Order):
         """Receive an order for preparation"""
-        print(f"👨‍🍳 [KitchenManager] Received order {order.id}")
-        print(f"   Items: {', '.join(item.name for item in order.items)}")
+        self._check_order(order)
+        self._enqueue(order)
+        self._process_queue()
+    
+    def receive_orders(self, orders: List[Order]):
+        """Receive a batch of orders (e.g. catering) in one step"""
+        # Validate the whole batch first so a bad order queues nothing
+        for order in orders:
+            self._check_order(order)
+        for order in orders:
+            self._enqueue(order)
+            self._process_queue()
+    
+    @staticmethod
+    def _check_order(order: Order):
+        """Reject orders the kitchen cannot prepare"""
+        if not order.items:
+            raise ValueError(f"Order {order.id} has no items")
+    
+    def _enqueue(self, order: Order):
+        """Log and queue one already-checked order"""
+        logger.info("👨‍🍳 [KitchenManager] Received order %s", order.id)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("   Items: %s", ", ".join(item.name for item in order.items))
         
         # Calculate total preparation time
         prep_time = max(item.preparation_time for item in order.items)
-        print(f"   Estimated time: {prep_time} minutes")
+        logger.info("   Estimated time: %d minutes", prep_time)
         
         self.prep_queue.append(order)
-        self._process_queue()
     
     def _process_queue(self):
         """Process orders in queue"""
         if self.prep_queue:
-            order = self.prep_queue.pop(0)
+            order = self.prep_queue.popleft()
             self.preparing[order.id] = order
-            print(f"👨‍🍳 [KitchenManager] Started preparing order {order.id}")
+            logger.info("👨‍🍳 [KitchenManager] Started preparing order %s", order.id)
     
     def mark_order_ready(self, order_id: str):
         """Mark order as ready"""
-        if order_id in self.preparing:
-            order = self.preparing.pop(order_id)
-            print(f"👨‍🍳 [KitchenManager] Order {order.id} is READY! 🍽️")
+        order = self.preparing.pop(order_id, None)
+        if order is not None:
+            logger.info("👨‍🍳 [KitchenManager] Order %s is READY! 🍽️", order.id)
             return order
         return None
 
@@ -177,6 +255,16 @@ class KitchenManager:
 # This module tracks inventory levels.
 # Independent module that can be used by multiple systems.
 
+class Ingredient(IntEnum):
+    """Ingredients tracked by the inventory (values index the stock list)"""
+    BEEF_PATTY = 0
+    BUN = 1
+    LETTUCE = 2
+    TOMATO = 3
+    CHEESE = 4
+    POTATO = 5
+
+
 class InventoryManager:
     """
     Manages restaurant inventory.
@@ -190,45 +278,64 @@ class InventoryManager:
     This component can be used by kitchen, ordering, and reporting systems.
     """
     
+    # Ingredients (and quantities) each menu item consumes
+    _REQUIRED: Final[Dict[str, Tuple[Tuple[Ingredient, int], ...]]] = {
+        "burger": (
+            (Ingredient.BEEF_PATTY, 1), (Ingredient.BUN, 1), (Ingredient.LETTUCE, 1),
+            (Ingredient.TOMATO, 1), (Ingredient.CHEESE, 1),
+        ),
+        "fries": ((Ingredient.POTATO, 1),),
+        "salad": ((Ingredient.LETTUCE, 2), (Ingredient.TOMATO, 1)),
+        "drink": (),  # No ingredients needed
+    }
+    
     def __init__(self):
-        self.stock: Dict[str, int] = {
-            "beef_patty": 50,
-            "bun": 100,
-            "lettuce": 30,
-            "tomato": 25,
-            "cheese": 40,
-            "potato": 200,
-        }
+        # Indexed by Ingredient, so lookups are list indexing, not string hashing
+        self.stock: List[int] = [0] * len(Ingredient)
+        self.stock[Ingredient.BEEF_PATTY] = 50
+        self.stock[Ingredient.BUN] = 100
+        self.stock[Ingredient.LETTUCE] = 30
+        self.stock[Ingredient.TOMATO] = 25
+        self.stock[Ingredient.CHEESE] = 40
+        self.stock[Ingredient.POTATO] = 200
     
     def check_availability(self, item_id: str) -> bool:
         """Check if item ingredients are available"""
         # Simplified: just check if we have stock
-        required_ingredients = {
-            "burger": ["beef_patty", "bun", "lettuce", "tomato", "cheese"],
-            "fries": ["potato"],
-            "salad": ["lettuce", "tomato"],
-            "drink": []  # No ingredients needed
-        }
-        
-        ingredients = required_ingredients.get(item_id, [])
-        for ingredient in ingredients:
-            if self.stock.get(ingredient, 0) < 1:
-                print(f"📦 [InventoryManager] ⚠️  Low stock: {ingredient}")
+        for ingredient, _ in self._REQUIRED.get(item_id, ()):
+            if self.stock[ingredient] < 1:
+                logger.warning("📦 [InventoryManager] ⚠️  Low stock: %s", ingredient.name.lower())
                 return False
         return True
     
     def use_ingredients(self, item_id: str):
         """Deduct ingredients for an item"""
-        required_ingredients = {
-            "burger": {"beef_patty": 1, "bun": 1, "lettuce": 1, "tomato": 1, "cheese": 1},
-            "fries": {"potato": 1},
-            "salad": {"lettuce": 2, "tomato": 1},
-        }
-        
-        ingredients = required_ingredients.get(item_id, {})
-        for ingredient, quantity in ingredients.items():
+        for ingredient, quantity in self._REQUIRED.get(item_id, ()):
             self.stock[ingredient] = max(0, self.stock[ingredient] - quantity)
-            print(f"📦 [InventoryManager] Used {quantity}x {ingredient}")
+            logger.info("📦 [InventoryManager] Used %dx %s", quantity, ingredient.name.lower())
+    
+    def reserve_batch(self, item_ids: List[str]) -> bool:
+        """
+        Check and deduct ingredients for a whole order at once.
+        
+        Needs are summed across all items first, so stock is only touched
+        if every item can be made (no check-then-deduct race).
+        """
+        needed = Counter()
+        for item_id in item_ids:
+            for ingredient, quantity in self._REQUIRED.get(item_id, ()):
+                needed[ingredient] += quantity
+        
+        stock = self.stock
+        for ingredient, quantity in needed.items():
+            if stock[ingredient] < quantity:
+                logger.warning("📦 [InventoryManager] ⚠️  Low stock: %s", ingredient.name.lower())
+                return False
+        
+        for ingredient, quantity in needed.items():
+            stock[ingredient] -= quantity
+            logger.info("📦 [InventoryManager] Used %dx %s", quantity, ingredient.name.lower())
+        return True
 
 
 # ============================================================================
@@ -247,9 +354,28 @@ class NotificationService:
     - Separation of concerns
     """
     
+    # Upper bound on notifications in flight at once during a batch send
+    MAX_CONCURRENT_SENDS = 50
+    
     def send_notification(self, customer_name: str, message: str):
         """Send notification to customer"""
-        print(f"📱 [NotificationService] Notifying {customer_name}: {message}")
+        logger.info("📱 [NotificationService] Notifying %s: %s", customer_name, message)
+    
+    async def send_async(self, customer_name: str, message: str):
+        """Send notification to customer without blocking the event loop"""
+        # A real channel (SMS, email, push) would await its network call here
+        await asyncio.sleep(0)
+        logger.info("📱 [NotificationService] Notifying %s: %s", customer_name, message)
+    
+    async def send_batch(self, messages: List[Tuple[str, str]]):
+        """Send several (customer_name, message) notifications concurrently"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        
+        async def send_one(customer_name: str, message: str):
+            async with semaphore:
+                await self.send_async(customer_name, message)
+        
+        await asyncio.gather(*(send_one(name, message) for name, message in messages))
 
 
 # ============================================================================
@@ -279,14 +405,14 @@ class RestaurantSystem:
         self.inventory_manager = InventoryManager()
         self.notification_service = NotificationService()
         
-        print("🏗️  [RestaurantSystem] System initialized with all components")
+        logger.info("🏗️  [RestaurantSystem] System initialized with all components")
     
     def place_order(self, customer_name: str, item_ids: List[str]) -> Optional[Order]:
         """
         Place a new order.
         
         This method orchestrates multiple components:
-        1. Check inventory
+        1. Reserve inventory
         2. Create order
         3. Send to kitchen
         4. Notify customer
@@ -294,28 +420,21 @@ class RestaurantSystem:
         Architecture Principle: High Cohesion
         Related functionality is grouped together.
         """
-        print(f"\n{'='*70}")
-        print(f"🛒 Processing order for {customer_name}")
-        print(f"{'='*70}")
+        logger.info("\n%s\n🛒 Processing order for %s\n%s", _EQ70, customer_name, _EQ70)
         
-        # Step 1: Check inventory
-        for item_id in item_ids:
-            if not self.inventory_manager.check_availability(item_id):
-                print(f"❌ Cannot fulfill order: {item_id} out of stock")
-                return None
+        # Step 1: Reserve inventory (check + deduct in one step)
+        if not self.inventory_manager.reserve_batch(item_ids):
+            logger.warning("❌ Cannot fulfill order: ingredients out of stock")
+            return None
         
         # Step 2: Create order
         order = self.order_manager.create_order(customer_name, item_ids)
         
-        # Step 3: Use ingredients
-        for item_id in item_ids:
-            self.inventory_manager.use_ingredients(item_id)
-        
-        # Step 4: Send to kitchen
+        # Step 3: Send to kitchen
         self.kitchen_manager.receive_order(order)
         self.order_manager.update_order_status(order.id, OrderStatus.CONFIRMED)
         
-        # Step 5: Notify customer
+        # Step 4: Notify customer
         self.notification_service.send_notification(
             customer_name,
             f"Order {order.id} confirmed! Total: ${order.total:.2f}"
@@ -323,6 +442,40 @@ class RestaurantSystem:
         
         return order
     
+    async def place_orders_batch(self, specs: List[Tuple[str, List[str]]]) -> List[Order]:
+        """
+        Place several orders at once (e.g. a catering booking).
+        
+        Each step runs across the whole batch before the next one starts.
+        Inventory is reserved for all orders together, so either every
+        order is placed or none is (an empty list is returned).
+        Confirmations are sent concurrently; from sync code use
+        asyncio.run(restaurant.place_orders_batch(specs)).
+        """
+        logger.info("\n%s\n🛒 Processing batch of %d orders\n%s", _EQ70, len(specs), _EQ70)
+        
+        # Step 1: Reserve inventory for the whole batch
+        all_item_ids = [item_id for _, item_ids in specs for item_id in item_ids]
+        if not self.inventory_manager.reserve_batch(all_item_ids):
+            logger.warning("❌ Cannot fulfill batch: ingredients out of stock")
+            return []
+        
+        # Step 2: Create orders
+        orders = self.order_manager.create_orders_batch(specs)
+        
+        # Step 3: Send to kitchen
+        self.kitchen_manager.receive_orders(orders)
+        for order in orders:
+            self.order_manager.update_order_status(order.id, OrderStatus.CONFIRMED)
+        
+        # Step 4: Notify customers
+        await self.notification_service.send_batch([
+            (order.customer_name, f"Order {order.id} confirmed! Total: ${order.total:.2f}")
+            for order in orders
+        ])
+        
+        return orders
+    
     def complete_order(self, order_id: str):
         """Mark order as ready and notify customer"""
         order = self.order_manager.get_order(order_id)
@@ -345,9 +498,12 @@ def demonstrate_modularity():
     Demonstrate how modularity enables building complex systems
     from simple, independent components.
     """
-    print("=" * 70)
+    # Components log instead of printing; the demo shows those messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    print(_EQ70)
     print("EXAMPLE 2: Modularity and Components in Software Architecture")
-    print("=" * 70)
+    print(_EQ70)
     print("\n📚 Key Concepts:")
     print("   • Modularity: Building systems from independent components")
     print("   • Separation of Concerns: Each component has one responsibility")
@@ -357,9 +513,9 @@ def demonstrate_modularity():
     # Create the restaurant system
     restaurant = RestaurantSystem()
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Customer Places Order")
-    print("=" * 70)
+    print(_EQ70)
     
     # Place an order - watch how multiple components work together!
     order1 = restaurant.place_order(
@@ -367,26 +523,26 @@ def demonstrate_modularity():
         item_ids=["burger", "fries", "drink"]
     )
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Kitchen Completes Order")
-    print("=" * 70)
+    print(_EQ70)
     
     # Simulate kitchen completing the order
     if order1:
         restaurant.complete_order(order1.id)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("SCENARIO: Another Customer Order")
-    print("=" * 70)
+    print(_EQ70)
     
     order2 = restaurant.place_order(
         customer_name="Bob",
         item_ids=["salad", "drink"]
     )
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("KEY INSIGHT: Architecture Enables Scalability")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     By using modularity:
     
@@ -405,9 +561,9 @@ def demonstrate_modularity():
     This is the power of modular architecture!
     """)
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("REAL-WORLD BUSINESS BENEFITS")
-    print("=" * 70)
+    print(_EQ70)
     print("""
     In a real restaurant business:
     
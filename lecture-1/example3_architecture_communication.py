@@ -12,10 +12,16 @@ Key Concept: Architecture is not just code - it's a communication tool
 that helps teams understand, discuss, and build systems together.
 """
 
-from typing import List, Dict, Set
+from typing import Final, List, Dict, Set
+import contextlib
+import io
+import sys
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 # ============================================================================
@@ -30,14 +36,14 @@ from enum import Enum
 # Architecture diagrams and models help everyone speak the same language!
 
 
-class UserRole(Enum):
+class UserRole(IntEnum):
     """User roles in the system"""
-    USER = "user"
-    MODERATOR = "moderator"
-    ADMIN = "admin"
+    USER = 0
+    MODERATOR = 1
+    ADMIN = 2
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     """Represents a user"""
     id: str
@@ -47,7 +53,7 @@ class User:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Post:
     """Represents a social media post"""
     id: str
@@ -63,21 +69,12 @@ class Post:
 # This view shows the functional components and their relationships.
 # Useful for: Product managers, business analysts, new developers
 
-class LogicalArchitectureView:
+# Each view's text is assembled once at import and emitted with a single write
+_LOGICAL_VIEW: Final[str] = "\n".join((
+    _EQ70,
+    "VIEW 1: LOGICAL ARCHITECTURE (What the system does)",
+    _EQ70,
     """
-    Logical view of the system architecture.
-    
-    Shows WHAT the system does, not HOW it's implemented.
-    This is the "business logic" view.
-    """
-    
-    @staticmethod
-    def visualize():
-        """Visualize the logical architecture"""
-        print("=" * 70)
-        print("VIEW 1: LOGICAL ARCHITECTURE (What the system does)")
-        print("=" * 70)
-        print("""
         ┌─────────────────────────────────────────────────────────┐
         │              Social Media Platform                      │
         ├─────────────────────────────────────────────────────────┤
@@ -105,16 +102,35 @@ class LogicalArchitectureView:
         • Content Management: Handles posts, comments, media
         • Feed Generation: Creates personalized feeds
         • Recommendation Engine: Suggests content to users
-        """)
+        """,
+)) + "\n"
+
+_LOGICAL_NOTES: Final[str] = "\n".join((
+    "\n💡 What this view tells us:",
+    "   • The main functional areas of the system",
+    "   • How components interact at a high level",
+    "   • What capabilities the system provides",
+    "   • Good for: Product planning, feature discussions",
+)) + "\n"
+
+
+class LogicalArchitectureView:
+    """
+    Logical view of the system architecture.
+    
+    Shows WHAT the system does, not HOW it's implemented.
+    This is the "business logic" view.
+    """
+    
+    @staticmethod
+    def visualize():
+        """Visualize the logical architecture"""
+        sys.stdout.write(_LOGICAL_VIEW)
     
     @staticmethod
     def explain():
         """Explain what this view communicates"""
-        print("\n💡 What this view tells us:")
-        print("   • The main functional areas of the system")
-        print("   • How components interact at a high level")
-        print("   • What capabilities the system provides")
-        print("   • Good for: Product planning, feature discussions")
+        sys.stdout.write(_LOGICAL_NOTES)
 
 
 # ============================================================================
@@ -123,21 +139,11 @@ class LogicalArchitectureView:
 # This view shows the actual infrastructure and deployment.
 # Useful for: DevOps, infrastructure team, scalability planning
 
-class PhysicalArchitectureView:
-    """
-    Physical view of the system architecture.
-    
-    Shows HOW the system is deployed and where components run.
-    This is the "infrastructure" view.
+_PHYSICAL_VIEW: Final[str] = "\n".join((
+    "\n" + _EQ70,
+    "VIEW 2: PHYSICAL ARCHITECTURE (How it's deployed)",
+    _EQ70,
     """
-    
-    @staticmethod
-    def visualize():
-        """Visualize the physical architecture"""
-        print("\n" + "=" * 70)
-        print("VIEW 2: PHYSICAL ARCHITECTURE (How it's deployed)")
-        print("=" * 70)
-        print("""
         ┌─────────────────────────────────────────────────────────┐
         │                    Internet                              │
         └────────────────────┬────────────────────────────────────┘
@@ -175,16 +181,35 @@ class PhysicalArchitectureView:
         • Web Servers: Handle HTTP requests (3 regions)
         • App Servers: Run application logic
         • Database: Stores data (replicated for availability)
-        """)
+        """,
+)) + "\n"
+
+_PHYSICAL_NOTES: Final[str] = "\n".join((
+    "\n💡 What this view tells us:",
+    "   • Where components are physically deployed",
+    "   • How the system scales (horizontally)",
+    "   • Infrastructure requirements",
+    "   • Good for: DevOps, capacity planning, disaster recovery",
+)) + "\n"
+
+
+class PhysicalArchitectureView:
+    """
+    Physical view of the system architecture.
+    
+    Shows HOW the system is deployed and where components run.
+    This is the "infrastructure" view.
+    """
+    
+    @staticmethod
+    def visualize():
+        """Visualize the physical architecture"""
+        sys.stdout.write(_PHYSICAL_VIEW)
     
     @staticmethod
     def explain():
         """Explain what this view communicates"""
-        print("\n💡 What this view tells us:")
-        print("   • Where components are physically deployed")
-        print("   • How the system scales (horizontally)")
-        print("   • Infrastructure requirements")
-        print("   • Good for: DevOps, capacity planning, disaster recovery")
+        sys.stdout.write(_PHYSICAL_NOTES)
 
 
 # ============================================================================
@@ -193,21 +218,11 @@ class PhysicalArchitectureView:
 # This view shows the actual code components and their dependencies.
 # Useful for: Developers, architects, code reviewers
 
-class ComponentArchitectureView:
+_COMPONENT_VIEW: Final[str] = "\n".join((
+    "\n" + _EQ70,
+    "VIEW 3: COMPONENT ARCHITECTURE (What components exist)",
+    _EQ70,
     """
-    Component view of the system architecture.
-    
-    Shows the actual code components, classes, and their relationships.
-    This is the "implementation" view.
-    """
-    
-    @staticmethod
-    def visualize():
-        """Visualize the component architecture"""
-        print("\n" + "=" * 70)
-        print("VIEW 3: COMPONENT ARCHITECTURE (What components exist)")
-        print("=" * 70)
-        print("""
         ┌─────────────────────────────────────────────────────────┐
         │                    API Layer                             │
         │  ┌──────────┐  ┌──────────┐  ┌──────────┐             │
@@ -240,16 +255,35 @@ class ComponentArchitectureView:
         • Service Layer: Business logic
         • Data Access Layer: Database interactions
         • Database: Persistent storage
-        """)
+        """,
+)) + "\n"
+
+_COMPONENT_NOTES: Final[str] = "\n".join((
+    "\n💡 What this view tells us:",
+    "   • What code components exist",
+    "   • How components depend on each other",
+    "   • Where to add new features",
+    "   • Good for: Development, code reviews, refactoring",
+)) + "\n"
+
+
+class ComponentArchitectureView:
+    """
+    Component view of the system architecture.
+    
+    Shows the actual code components, classes, and their relationships.
+    This is the "implementation" view.
+    """
+    
+    @staticmethod
+    def visualize():
+        """Visualize the component architecture"""
+        sys.stdout.write(_COMPONENT_VIEW)
     
     @staticmethod
     def explain():
         """Explain what this view communicates"""
-        print("\n💡 What this view tells us:")
-        print("   • What code components exist")
-        print("   • How components depend on each other")
-        print("   • Where to add new features")
-        print("   • Good for: Development, code reviews, refactoring")
+        sys.stdout.write(_COMPONENT_NOTES)
 
 
 # ============================================================================
@@ -258,21 +292,11 @@ class ComponentArchitectureView:
 # This view shows how data flows through the system.
 # Useful for: Understanding system behavior, debugging, optimization
 
-class DataFlowArchitectureView:
+_DATAFLOW_VIEW: Final[str] = "\n".join((
+    "\n" + _EQ70,
+    "VIEW 4: DATA FLOW ARCHITECTURE (How data moves)",
+    _EQ70,
     """
-    Data flow view of the system architecture.
-    
-    Shows how data moves through the system for a specific use case.
-    This is the "behavioral" view.
-    """
-    
-    @staticmethod
-    def visualize_user_creates_post():
-        """Visualize data flow for creating a post"""
-        print("\n" + "=" * 70)
-        print("VIEW 4: DATA FLOW ARCHITECTURE (How data moves)")
-        print("=" * 70)
-        print("""
         Use Case: User Creates a Post
         
         1. User ──POST /api/posts──> API Layer
@@ -308,16 +332,35 @@ class DataFlowArchitectureView:
         8. API Layer ──> User
            │
            └─> 201 Created {post_id: "123", ...}
-        """)
+        """,
+)) + "\n"
+
+_DATAFLOW_NOTES: Final[str] = "\n".join((
+    "\n💡 What this view tells us:",
+    "   • The sequence of operations",
+    "   • Where data is transformed",
+    "   • Potential bottlenecks",
+    "   • Good for: Debugging, performance optimization, testing",
+)) + "\n"
+
+
+class DataFlowArchitectureView:
+    """
+    Data flow view of the system architecture.
+    
+    Shows how data moves through the system for a specific use case.
+    This is the "behavioral" view.
+    """
+    
+    @staticmethod
+    def visualize_user_creates_post():
+        """Visualize data flow for creating a post"""
+        sys.stdout.write(_DATAFLOW_VIEW)
     
     @staticmethod
     def explain():
         """Explain what this view communicates"""
-        print("\n💡 What this view tells us:")
-        print("   • The sequence of operations")
-        print("   • Where data is transformed")
-        print("   • Potential bottlenecks")
-        print("   • Good for: Debugging, performance optimization, testing")
+        sys.stdout.write(_DATAFLOW_NOTES)
 
 
 # ============================================================================
@@ -341,48 +384,32 @@ class ArchitectureDocumentation:
     @staticmethod
     def generate_all_views():
         """Generate all architecture views"""
-        print("\n" + "=" * 70)
-        print("GENERATING ARCHITECTURE DOCUMENTATION")
-        print("=" * 70)
-        
-        LogicalArchitectureView.visualize()
-        LogicalArchitectureView.explain()
-        
-        PhysicalArchitectureView.visualize()
-        PhysicalArchitectureView.explain()
-        
-        ComponentArchitectureView.visualize()
-        ComponentArchitectureView.explain()
-        
-        DataFlowArchitectureView.visualize_user_creates_post()
-        DataFlowArchitectureView.explain()
+        # Collect every view in memory, then emit the document in one write
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            print("\n" + _EQ70)
+            print("GENERATING ARCHITECTURE DOCUMENTATION")
+            print(_EQ70)
+            
+            LogicalArchitectureView.visualize()
+            LogicalArchitectureView.explain()
+            
+            PhysicalArchitectureView.visualize()
+            PhysicalArchitectureView.explain()
+            
+            ComponentArchitectureView.visualize()
+            ComponentArchitectureView.explain()
+            
+            DataFlowArchitectureView.visualize_user_creates_post()
+            DataFlowArchitectureView.explain()
+        sys.stdout.write(buffer.getvalue())
 
 
 # ============================================================================
 # DEMONSTRATION
 # ============================================================================
 
-def demonstrate_architecture_communication():
-    """
-    Demonstrate how architecture serves as a communication tool
-    for different stakeholders.
-    """
-    print("=" * 70)
-    print("EXAMPLE 3: Architecture as Communication Tool")
-    print("=" * 70)
-    print("\n📚 Key Concepts:")
-    print("   • Architecture helps teams communicate")
-    print("   • Different views for different audiences")
-    print("   • Architecture as living documentation")
-    print("   • Shared understanding enables better decisions")
-    
-    # Generate all views
-    ArchitectureDocumentation.generate_all_views()
-    
-    print("\n" + "=" * 70)
-    print("KEY INSIGHT: Architecture Enables Communication")
-    print("=" * 70)
-    print("""
+_STAKEHOLDER_GUIDE: Final[str] = """
     Different stakeholders need different views:
     
     👔 Business Stakeholders:
@@ -402,12 +429,9 @@ def demonstrate_architecture_communication():
        → Data Flow: "How does a user action work?"
     
     All views describe the SAME system, just from different perspectives!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("REAL-WORLD BUSINESS BENEFITS")
-    print("=" * 70)
-    print("""
+    """
+
+_BUSINESS_BENEFITS: Final[str] = """
     In a real software business:
     
     • Faster onboarding: New team members understand system quickly
@@ -418,7 +442,35 @@ def demonstrate_architecture_communication():
     • Documentation: Architecture diagrams serve as living documentation
     
     Architecture is not just code - it's a language for communication!
-    """)
+    """
+
+
+def demonstrate_architecture_communication():
+    """
+    Demonstrate how architecture serves as a communication tool
+    for different stakeholders.
+    """
+    print(_EQ70)
+    print("EXAMPLE 3: Architecture as Communication Tool")
+    print(_EQ70)
+    print("\n📚 Key Concepts:")
+    print("   • Architecture helps teams communicate")
+    print("   • Different views for different audiences")
+    print("   • Architecture as living documentation")
+    print("   • Shared understanding enables better decisions")
+    
+    # Generate all views
+    ArchitectureDocumentation.generate_all_views()
+    
+    print("\n" + _EQ70)
+    print("KEY INSIGHT: Architecture Enables Communication")
+    print(_EQ70)
+    print(_STAKEHOLDER_GUIDE)
+    
+    print("\n" + _EQ70)
+    print("REAL-WORLD BUSINESS BENEFITS")
+    print(_EQ70)
+    print(_BUSINESS_BENEFITS)
 
 
 if __name__ == "__main__":
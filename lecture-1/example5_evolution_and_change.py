@@ -13,10 +13,17 @@ Good architecture makes evolution easier, while poor architecture makes
 it harder and more expensive.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from array import array
+import sys
+from typing import Final, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from functools import cache
+from itertools import islice
+
+# Banner separator used throughout the demo output
+_EQ70 = "=" * 70
 
 
 # ============================================================================
@@ -32,7 +39,7 @@ from enum import Enum
 # This shows how architecture evolves over time!
 
 
-class SystemStage(Enum):
+class SystemStage(StrEnum):
     """Stages of system evolution"""
     MVP = "MVP - Minimum Viable Product"
     STARTUP = "Startup - Early Growth"
@@ -40,7 +47,7 @@ class SystemStage(Enum):
     ENTERPRISE = "Enterprise - Mature System"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemMetrics:
     """Metrics for system performance"""
     users: int
@@ -51,15 +58,56 @@ class SystemMetrics:
     complexity_score: int  # 1-10, higher = more complex
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArchitectureVersion:
-    """Represents an architecture version"""
+    """
+    Represents an architecture version.
+    
+    Frozen, because the describe() methods below return one shared
+    instance per stage. Those archetypes carry no created_at; it is
+    stamped when a version is added to an ArchitectureEvolution.
+    """
     version: str
     stage: SystemStage
     description: str
-    components: List[str]
+    components: Tuple[str, ...]
     metrics: SystemMetrics
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    
+    # Display strings, formatted once here rather than in every report
+    _users_str: str = field(init=False, repr=False, compare=False)
+    _rps_str: str = field(init=False, repr=False, compare=False)
+    _cost_str: str = field(init=False, repr=False, compare=False)
+    _date_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: set the derived fields via object.__setattr__
+        set_field = object.__setattr__
+        set_field(self, "_users_str", f"{self.metrics.users:,}")
+        set_field(self, "_rps_str", f"{self.metrics.requests_per_second:,}")
+        set_field(self, "_cost_str", f"{self.metrics.cost_per_month:,.0f}")
+        set_field(self, "_date_str",
+                  self.created_at.strftime('%Y-%m-%d') if self.created_at else "-")
+    
+    @property
+    def users_str(self) -> str:
+        """User count with thousands separators"""
+        return self._users_str
+    
+    @property
+    def rps_str(self) -> str:
+        """Requests per second with thousands separators"""
+        return self._rps_str
+    
+    @property
+    def cost_str(self) -> str:
+        """Monthly cost in whole dollars with thousands separators"""
+        return self._cost_str
+    
+    @property
+    def date_str(self) -> str:
+        """created_at as YYYY-MM-DD, or '-' if not stamped yet"""
+        return self._date_str
 
 
 # ============================================================================
@@ -83,18 +131,19 @@ class MVPArchitecture:
     """
     
     @staticmethod
+    @cache
     def describe() -> ArchitectureVersion:
         """Describe MVP architecture"""
         return ArchitectureVersion(
             version="1.0",
             stage=SystemStage.MVP,
             description="Simple monolithic application on single server",
-            components=[
+            components=(
                 "Web Server (Apache)",
                 "Application (Django/Python)",
                 "Database (SQLite)",
                 "File Storage (Local disk)"
-            ],
+            ),
             metrics=SystemMetrics(
                 users=100,
                 requests_per_second=10,
@@ -105,10 +154,8 @@ class MVPArchitecture:
             )
         )
     
-    @staticmethod
-    def visualize():
-        """Visualize MVP architecture"""
-        print("""
+    # Built once; visualize() just writes it out.
+    _DIAGRAM: Final[str] = """
         ┌─────────────────────────────────────┐
         │         Single Server               │
         │  ┌──────────┐  ┌──────────┐       │
@@ -124,7 +171,12 @@ class MVPArchitecture:
         
         Pros: Simple, cheap, fast to build
         Cons: Doesn't scale, single point of failure
-        """)
+        """ + "\n"
+    
+    @classmethod
+    def visualize(cls):
+        """Visualize MVP architecture"""
+        sys.stdout.write(cls._DIAGRAM)
 
 
 # ============================================================================
@@ -148,20 +200,21 @@ class StartupArchitecture:
     """
     
     @staticmethod
+    @cache
     def describe() -> ArchitectureVersion:
         """Describe startup architecture"""
         return ArchitectureVersion(
             version="2.0",
             stage=SystemStage.STARTUP,
             description="Separated web/app servers, production database",
-            components=[
+            components=(
                 "Load Balancer",
                 "Web Servers (2x)",
                 "Application Servers (2x)",
                 "Database (PostgreSQL)",
                 "File Storage (S3)",
                 "Monitoring (Basic)"
-            ],
+            ),
             metrics=SystemMetrics(
                 users=10_000,
                 requests_per_second=100,
@@ -172,10 +225,7 @@ class StartupArchitecture:
             )
         )
     
-    @staticmethod
-    def visualize():
-        """Visualize startup architecture"""
-        print("""
+    _DIAGRAM: Final[str] = """
         ┌─────────────────────────────────────┐
         │      Load Balancer                 │
         └──────────┬──────────────────────────┘
@@ -200,7 +250,12 @@ class StartupArchitecture:
         
         Pros: Better reliability, some scaling
         Cons: Still monolithic, manual scaling
-        """)
+        """ + "\n"
+    
+    @classmethod
+    def visualize(cls):
+        """Visualize startup architecture"""
+        sys.stdout.write(cls._DIAGRAM)
 
 
 # ============================================================================
@@ -225,13 +280,14 @@ class ScaleUpArchitecture:
     """
     
     @staticmethod
+    @cache
     def describe() -> ArchitectureVersion:
         """Describe scale-up architecture"""
         return ArchitectureVersion(
             version="3.0",
             stage=SystemStage.SCALEUP,
             description="Microservices with caching and CDN",
-            components=[
+            components=(
                 "Load Balancer",
                 "API Gateway",
                 "User Service (Microservice)",
@@ -242,7 +298,7 @@ class ScaleUpArchitecture:
                 "CDN (CloudFront)",
                 "Message Queue (RabbitMQ)",
                 "Monitoring (Prometheus + Grafana)"
-            ],
+            ),
             metrics=SystemMetrics(
                 users=1_000_000,
                 requests_per_second=10_000,
@@ -253,10 +309,7 @@ class ScaleUpArchitecture:
             )
         )
     
-    @staticmethod
-    def visualize():
-        """Visualize scale-up architecture"""
-        print("""
+    _DIAGRAM: Final[str] = """
         ┌─────────────────────────────────────┐
         │         CDN (CloudFront)            │
         └──────────┬──────────────────────────┘
@@ -283,7 +336,12 @@ class ScaleUpArchitecture:
         
         Pros: Highly scalable, performant
         Cons: Complex, expensive, operational overhead
-        """)
+        """ + "\n"
+    
+    @classmethod
+    def visualize(cls):
+        """Visualize scale-up architecture"""
+        sys.stdout.write(cls._DIAGRAM)
 
 
 # ============================================================================
@@ -308,13 +366,14 @@ class EnterpriseArchitecture:
     """
     
     @staticmethod
+    @cache
     def describe() -> ArchitectureVersion:
         """Describe enterprise architecture"""
         return ArchitectureVersion(
             version="4.0",
             stage=SystemStage.ENTERPRISE,
             description="Multi-region, enterprise-grade architecture",
-            components=[
+            components=(
                 "Global Load Balancer",
                 "Multi-Region API Gateways",
                 "Microservices (20+ services)",
@@ -327,7 +386,7 @@ class EnterpriseArchitecture:
                 "Analytics (Data Warehouse)",
                 "Security (WAF, DDoS Protection)",
                 "Monitoring (Full Observability Stack)"
-            ],
+            ),
             metrics=SystemMetrics(
                 users=100_000_000,
                 requests_per_second=1_000_000,
@@ -338,10 +397,7 @@ class EnterpriseArchitecture:
             )
         )
     
-    @staticmethod
-    def visualize():
-        """Visualize enterprise architecture"""
-        print("""
+    _DIAGRAM: Final[str] = """
         ┌─────────────────────────────────────────────────┐
         │         Global Load Balancer (Multi-Region)     │
         └──────┬──────────────┬──────────────┬─────────────┘
@@ -363,13 +419,94 @@ class EnterpriseArchitecture:
         
         Pros: Global scale, enterprise features
         Cons: Very complex, very expensive
-        """)
+        """ + "\n"
+    
+    @classmethod
+    def visualize(cls):
+        """Visualize enterprise architecture"""
+        sys.stdout.write(cls._DIAGRAM)
 
 
 # ============================================================================
 # EVOLUTION TRACKER
 # ============================================================================
 
+class StageMetricsTable:
+    """
+    SystemMetrics of every stage, stored column by column.
+    
+    Each metric is one contiguous array of doubles, so aggregating a
+    metric across stages walks a flat buffer instead of one object per
+    stage.
+    """
+    
+    COLUMNS = (
+        "users",
+        "requests_per_second",
+        "response_time_ms",
+        "uptime_percent",
+        "cost_per_month",
+        "complexity_score",
+    )
+    
+    def __init__(self):
+        self._columns: Dict[str, array] = {name: array('d') for name in self.COLUMNS}
+    
+    def __len__(self) -> int:
+        return len(self._columns["users"])
+    
+    def append(self, metrics: SystemMetrics):
+        """Add one stage's metrics as a new row"""
+        for name, column in self._columns.items():
+            column.append(getattr(metrics, name))
+    
+    def growth(self, name: str) -> float:
+        """Ratio of the latest stage's value to the first stage's"""
+        column = self._columns[name]
+        return column[-1] / column[0]
+
+
+# Timeline entry templates for show_evolution(), parsed once at import
+_VERSION_HEADER_TEMPLATE = (
+    "\n{index}. {stage}\n"
+    "   Version: {version}\n"
+    "   Date: {date}\n"
+    "   Key Changes:"
+)
+_VERSION_METRICS_TEMPLATE = (
+    "   Metrics:\n"
+    "     • Users: {users}\n"
+    "     • RPS: {requests_per_second}\n"
+    "     • Response: {response_time_ms}ms\n"
+    "     • Uptime: {uptime_percent}%\n"
+    "     • Cost: ${cost_per_month}/month"
+)
+
+
+def _format_version(index: int, version: ArchitectureVersion) -> str:
+    """Format one show_evolution() timeline entry"""
+    metrics = version.metrics
+    lines = [_VERSION_HEADER_TEMPLATE.format_map({
+        "index": index,
+        "stage": version.stage,
+        "version": version.version,
+        "date": version.date_str,
+    })]
+    component_count = len(version.components)
+    # Show the first 3 components, then a count of the rest
+    lines.extend(f"     • {component}" for component in islice(version.components, 3))
+    if component_count > 3:
+        lines.append(f"     • ... and {component_count - 3} more")
+    lines.append(_VERSION_METRICS_TEMPLATE.format_map({
+        "users": version.users_str,
+        "requests_per_second": version.rps_str,
+        "response_time_ms": metrics.response_time_ms,
+        "uptime_percent": metrics.uptime_percent,
+        "cost_per_month": version.cost_str,
+    }))
+    return "\n".join(lines)
+
+
 class ArchitectureEvolution:
     """
     Tracks how architecture evolves over time.
@@ -382,139 +519,114 @@ class ArchitectureEvolution:
     """
     
     def __init__(self):
-        self.versions: List[ArchitectureVersion] = []
+        self._versions: List[ArchitectureVersion] = []
+        # Tuple snapshot of _versions, rebuilt only after the history changes
+        self._snapshot: Optional[Tuple[ArchitectureVersion, ...]] = None
+        self.metrics_table = StageMetricsTable()
+    
+    @property
+    def versions(self) -> Tuple[ArchitectureVersion, ...]:
+        """Read-only snapshot of the history, oldest first"""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._versions)
+        return self._snapshot
+    
+    @classmethod
+    def from_versions(cls, versions: Tuple[ArchitectureVersion, ...]) -> "ArchitectureEvolution":
+        """Build a timeline from a known history in one go, without printing"""
+        evolution = cls()
+        now = datetime.now()
+        evolution._versions.extend(
+            version if version.created_at is not None
+            else replace(version, created_at=now)
+            for version in versions
+        )
+        for version in evolution._versions:
+            evolution.metrics_table.append(version.metrics)
+        return evolution
     
     def add_version(self, version: ArchitectureVersion):
-        """Add an architecture version"""
-        self.versions.append(version)
-        print(f"\n📅 {version.stage.value}")
-        print(f"   Version: {version.version}")
-        print(f"   {version.description}")
-        print(f"   Components: {len(version.components)}")
-        print(f"   Users: {version.metrics.users:,}")
-        print(f"   Cost: ${version.metrics.cost_per_month:,.0f}/month")
-        print(f"   Complexity: {version.metrics.complexity_score}/10")
+        """Add one architecture version and print its summary"""
+        if version.created_at is None:
+            version = replace(version, created_at=datetime.now())
+        metrics = version.metrics
+        self._versions.append(version)
+        self._snapshot = None
+        self.metrics_table.append(metrics)
+        sys.stdout.write(
+            f"\n📅 {version.stage}\n"
+            f"   Version: {version.version}\n"
+            f"   {version.description}\n"
+            f"   Components: {len(version.components)}\n"
+            f"   Users: {version.users_str}\n"
+            f"   Cost: ${version.cost_str}/month\n"
+            f"   Complexity: {metrics.complexity_score}/10\n"
+        )
     
     def show_evolution(self):
         """Show the evolution timeline"""
-        print("\n" + "=" * 70)
-        print("ARCHITECTURE EVOLUTION TIMELINE")
-        print("=" * 70)
-        
-        for i, version in enumerate(self.versions):
-            print(f"\n{i+1}. {version.stage.value}")
-            print(f"   Version: {version.version}")
-            print(f"   Date: {version.created_at.strftime('%Y-%m-%d')}")
-            print(f"   Key Changes:")
-            for component in version.components[:3]:  # Show first 3
-                print(f"     • {component}")
-            if len(version.components) > 3:
-                print(f"     • ... and {len(version.components) - 3} more")
-            print(f"   Metrics:")
-            print(f"     • Users: {version.metrics.users:,}")
-            print(f"     • RPS: {version.metrics.requests_per_second:,}")
-            print(f"     • Response: {version.metrics.response_time_ms}ms")
-            print(f"     • Uptime: {version.metrics.uptime_percent}%")
-            print(f"     • Cost: ${version.metrics.cost_per_month:,.0f}/month")
+        lines = ["", _EQ70, "ARCHITECTURE EVOLUTION TIMELINE", _EQ70]
+        lines.extend(
+            _format_version(i, version) for i, version in enumerate(self._versions, 1)
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def analyze_evolution(self):
         """Analyze the evolution"""
-        print("\n" + "=" * 70)
-        print("EVOLUTION ANALYSIS")
-        print("=" * 70)
-        
-        if len(self.versions) < 2:
-            return
+        lines = ["", _EQ70, "EVOLUTION ANALYSIS", _EQ70]
         
-        first = self.versions[0]
-        last = self.versions[-1]
+        if len(self._versions) >= 2:
+            first = self._versions[0]
+            last = self._versions[-1]
+            first_complexity = first.metrics.complexity_score
+            last_complexity = last.metrics.complexity_score
+            table = self.metrics_table
+            user_growth = f"{table.growth('users'):,.0f}x"
+            rps_growth = f"{table.growth('requests_per_second'):,.0f}x"
+            cost_growth = f"{table.growth('cost_per_month'):,.0f}x"
+            
+            lines += [
+                "\n📊 Growth Metrics:",
+                f"   Users: {first.users_str} → {last.users_str} "
+                f"({user_growth} growth)",
+                f"   RPS: {first.rps_str} → {last.rps_str} "
+                f"({rps_growth} growth)",
+                f"   Cost: ${first.cost_str} → ${last.cost_str} "
+                f"({cost_growth} increase)",
+                f"   Complexity: {first_complexity} → {last_complexity} "
+                f"({last_complexity - first_complexity:+d})",
+                "\n💡 Key Insights:",
+                f"   • System grew {user_growth}",
+                "   • Architecture evolved to handle growth",
+                "   • Complexity increased as features were added",
+                "   • Cost increased but enabled much larger scale",
+            ]
         
-        print(f"\n📊 Growth Metrics:")
-        print(f"   Users: {first.metrics.users:,} → {last.metrics.users:,} "
-              f"({last.metrics.users / first.metrics.users:,.0f}x growth)")
-        print(f"   RPS: {first.metrics.requests_per_second:,} → "
-              f"{last.metrics.requests_per_second:,} "
-              f"({last.metrics.requests_per_second / first.metrics.requests_per_second:,.0f}x growth)")
-        print(f"   Cost: ${first.metrics.cost_per_month:,.0f} → "
-              f"${last.metrics.cost_per_month:,.0f} "
-              f"({last.metrics.cost_per_month / first.metrics.cost_per_month:,.0f}x increase)")
-        print(f"   Complexity: {first.metrics.complexity_score} → "
-              f"{last.metrics.complexity_score} "
-              f"({last.metrics.complexity_score - first.metrics.complexity_score:+d})")
-        
-        print(f"\n💡 Key Insights:")
-        print(f"   • System grew {last.metrics.users / first.metrics.users:,.0f}x")
-        print(f"   • Architecture evolved to handle growth")
-        print(f"   • Complexity increased as features were added")
-        print(f"   • Cost increased but enabled much larger scale")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
 # DEMONSTRATION
 # ============================================================================
 
-def demonstrate_evolution():
+# Narrative text for demonstrate_evolution(), built once at import
+_INTRO: Final[str] = "\n".join((
+    _EQ70,
+    "EXAMPLE 5: Evolution and Change in Software Architecture",
+    _EQ70,
+    "\n📚 Key Concepts:",
+    "   • Systems must evolve to meet changing requirements",
+    "   • Architecture decisions impact future evolution",
+    "   • Good architecture makes evolution easier",
+    "   • Poor architecture creates technical debt",
+)) + "\n"
+
+_KEY_INSIGHT: Final[str] = "\n".join((
+    "",
+    _EQ70,
+    "KEY INSIGHT: Architecture Enables Evolution",
+    _EQ70,
     """
-    Demonstrate how software architecture evolves over time.
-    """
-    print("=" * 70)
-    print("EXAMPLE 5: Evolution and Change in Software Architecture")
-    print("=" * 70)
-    print("\n📚 Key Concepts:")
-    print("   • Systems must evolve to meet changing requirements")
-    print("   • Architecture decisions impact future evolution")
-    print("   • Good architecture makes evolution easier")
-    print("   • Poor architecture creates technical debt")
-    
-    # Create evolution tracker
-    evolution = ArchitectureEvolution()
-    
-    # Stage 1: MVP
-    print("\n" + "=" * 70)
-    print("STAGE 1: MVP (Month 0)")
-    print("=" * 70)
-    MVPArchitecture.visualize()
-    mvp = MVPArchitecture.describe()
-    evolution.add_version(mvp)
-    
-    # Stage 2: Startup
-    print("\n" + "=" * 70)
-    print("STAGE 2: Startup (Month 6)")
-    print("=" * 70)
-    print("💼 Business Growth: 100 → 10,000 users")
-    print("🔧 Architecture Change: Separate servers, production database")
-    StartupArchitecture.visualize()
-    startup = StartupArchitecture.describe()
-    evolution.add_version(startup)
-    
-    # Stage 3: Scale-up
-    print("\n" + "=" * 70)
-    print("STAGE 3: Scale-up (Month 18)")
-    print("=" * 70)
-    print("💼 Business Growth: 10,000 → 1,000,000 users")
-    print("🔧 Architecture Change: Microservices, caching, CDN")
-    ScaleUpArchitecture.visualize()
-    scaleup = ScaleUpArchitecture.describe()
-    evolution.add_version(scaleup)
-    
-    # Stage 4: Enterprise
-    print("\n" + "=" * 70)
-    print("STAGE 4: Enterprise (Month 36)")
-    print("=" * 70)
-    print("💼 Business Growth: 1,000,000 → 100,000,000 users")
-    print("🔧 Architecture Change: Multi-region, enterprise features")
-    EnterpriseArchitecture.visualize()
-    enterprise = EnterpriseArchitecture.describe()
-    evolution.add_version(enterprise)
-    
-    # Show evolution
-    evolution.show_evolution()
-    evolution.analyze_evolution()
-    
-    print("\n" + "=" * 70)
-    print("KEY INSIGHT: Architecture Enables Evolution")
-    print("=" * 70)
-    print("""
     Good architecture decisions enable evolution:
     
     ✅ MVP: Simple and fast to build
@@ -541,12 +653,15 @@ def demonstrate_evolution():
        → System becomes unmaintainable
     
     The key: Build for today, design for tomorrow!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("REAL-WORLD BUSINESS LESSONS")
-    print("=" * 70)
-    print("""
+    """,
+)) + "\n"
+
+_REAL_WORLD_LESSONS: Final[str] = "\n".join((
+    "",
+    _EQ70,
+    "REAL-WORLD BUSINESS LESSONS",
+    _EQ70,
+    """
     Real companies evolve their architecture:
     
     Amazon:
@@ -566,7 +681,62 @@ def demonstrate_evolution():
     
     The architecture that works for 100 users won't work
     for 100 million users. Evolution is inevitable!
-    """)
+    """,
+)) + "\n"
+
+
+def demonstrate_evolution():
+    """
+    Demonstrate how software architecture evolves over time.
+    """
+    sys.stdout.write(_INTRO)
+    
+    # Create evolution tracker
+    evolution = ArchitectureEvolution()
+    
+    # Stage 1: MVP
+    print("\n" + _EQ70)
+    print("STAGE 1: MVP (Month 0)")
+    print(_EQ70)
+    MVPArchitecture.visualize()
+    mvp = MVPArchitecture.describe()
+    evolution.add_version(mvp)
+    
+    # Stage 2: Startup
+    print("\n" + _EQ70)
+    print("STAGE 2: Startup (Month 6)")
+    print(_EQ70)
+    print("💼 Business Growth: 100 → 10,000 users")
+    print("🔧 Architecture Change: Separate servers, production database")
+    StartupArchitecture.visualize()
+    startup = StartupArchitecture.describe()
+    evolution.add_version(startup)
+    
+    # Stage 3: Scale-up
+    print("\n" + _EQ70)
+    print("STAGE 3: Scale-up (Month 18)")
+    print(_EQ70)
+    print("💼 Business Growth: 10,000 → 1,000,000 users")
+    print("🔧 Architecture Change: Microservices, caching, CDN")
+    ScaleUpArchitecture.visualize()
+    scaleup = ScaleUpArchitecture.describe()
+    evolution.add_version(scaleup)
+    
+    # Stage 4: Enterprise
+    print("\n" + _EQ70)
+    print("STAGE 4: Enterprise (Month 36)")
+    print(_EQ70)
+    print("💼 Business Growth: 1,000,000 → 100,000,000 users")
+    print("🔧 Architecture Change: Multi-region, enterprise features")
+    EnterpriseArchitecture.visualize()
+    enterprise = EnterpriseArchitecture.describe()
+    evolution.add_version(enterprise)
+    
+    # Show evolution
+    evolution.show_evolution()
+    evolution.analyze_evolution()
+    
+    sys.stdout.write(_KEY_INSIGHT + _REAL_WORLD_LESSONS)
 
 
 if __name__ == "__main__":